@@ -20,6 +20,7 @@ from typing import (  # noqa: WPS235
     overload,
 )
 from uuid import uuid4
+from weakref import WeakSet
 
 from typing_extensions import ParamSpec, TypeAlias
 
@@ -35,6 +36,7 @@ from taskiq.utils import maybe_awaitable, remove_suffix
 if TYPE_CHECKING:  # pragma: no cover
     from taskiq.abc.formatter import TaskiqFormatter
     from taskiq.abc.result_backend import AsyncResultBackend
+    from taskiq.receiver import Receiver
 
 _T = TypeVar("_T")  # noqa: WPS111
 _FuncParams = ParamSpec("_FuncParams")
@@ -92,6 +94,8 @@ class AsyncBroker(ABC):
         ] = defaultdict(list)
         self.state = TaskiqState()
         self.custom_dependency_context: Dict[Any, Any] = {}
+        # Receivers that must know about new middlewares.
+        self.receivers: "WeakSet[Receiver]" = WeakSet()
 
     def add_dependency_context(self, new_ctx: Dict[Any, Any]) -> None:
         """
@@ -109,7 +113,8 @@ class AsyncBroker(ABC):
         Add a list of middlewares.
 
         You should call this method to set middlewares,
-        since it saves current broker in all middlewares.
+        since it saves current broker in all middlewares
+        and notifies receivers about them.
 
         :param middlewares: list of middlewares.
         """
@@ -122,6 +127,8 @@ class AsyncBroker(ABC):
                 continue
             middleware.set_broker(self)
             self.middlewares.append(middleware)
+        for receiver in self.receivers:
+            receiver.update_middlewares()
 
     async def startup(self) -> None:
         """Do something when starting broker."""
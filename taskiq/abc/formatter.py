@@ -23,3 +23,16 @@ class TaskiqFormatter(ABC):
         :param message: message to parse.
         :return: parsed taskiq message.
         """
+
+    def peek_valid(self, message: bytes) -> bool:
+        """
+        Cheap check that message can be parsed.
+
+        It's called before `loads`, so obviously wrong messages
+        are skipped without raising and catching exceptions.
+        Returning True doesn't guarantee that message is valid.
+
+        :param message: message to check.
+        :return: False if message surely cannot be parsed.
+        """
+        return bool(message)
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, List, Optional, Tuple, TypeVar
 
 from taskiq.result import TaskiqResult
 
@@ -28,6 +29,29 @@ class AsyncResultBackend(ABC, Generic[_ReturnType]):
         :return: nothing.
         """
 
+    async def set_results(
+        self,
+        results: List[Tuple[str, TaskiqResult[_ReturnType]]],
+    ) -> List[Optional[BaseException]]:
+        """
+        Saves multiple results to the result backend.
+
+        Worker uses this method when results are saved in batches.
+        By default it calls set_result for every result concurrently,
+        override it if your storage can save many results
+        in a single request.
+
+        Errors of separate results must be returned,
+        so other results of the batch are handled as saved.
+
+        :param results: list of task ids and their results.
+        :return: error for every result, or None if it's saved.
+        """
+        return await asyncio.gather(
+            *[self.set_result(task_id, result) for task_id, result in results],
+            return_exceptions=True,
+        )
+
     @abstractmethod
     async def is_result_ready(self, task_id: str) -> bool:
         """
@@ -24,6 +24,8 @@ class WorkerArgs:
     reload: bool = False
     no_gitignore: bool = False
     max_async_tasks: int = 100
+    results_batch_size: int = 1
+    executor_parse_threshold: Optional[int] = None
 
     @classmethod
     def from_cli(  # noqa: WPS213
@@ -132,6 +134,23 @@ class WorkerArgs:
             default=100,
             help="Maximum simultaneous async tasks per worker process. ",
         )
+        parser.add_argument(
+            "--results-batch-size",
+            type=int,
+            dest="results_batch_size",
+            default=1,
+            help="Maximum number of results saved in result backend at once.",
+        )
+        parser.add_argument(
+            "--executor-parse-threshold",
+            type=int,
+            dest="executor_parse_threshold",
+            default=None,
+            help=(
+                "Size of message in bytes, starting from which "
+                "messages are parsed in threadpool."
+            ),
+        )
 
         namespace = parser.parse_args(args)
         return WorkerArgs(**namespace.__dict__)
@@ -113,6 +113,8 @@ def start_listen(args: WorkerArgs) -> None:  # noqa: WPS213
                 executor=pool,
                 validate_params=not args.no_parse,
                 max_async_tasks=args.max_async_tasks,
+                results_batch_size=args.results_batch_size,
+                executor_parse_threshold=args.executor_parse_threshold,
             )
             loop.run_until_complete(receiver.listen())
     except KeyboardInterrupt:
@@ -1,6 +1,11 @@
+import re
+
 from taskiq.abc.formatter import TaskiqFormatter
 from taskiq.message import BrokerMessage, TaskiqMessage
 
+# Every taskiq message is serialized as a JSON object.
+_JSON_OBJECT_START = re.compile(rb"\s*\{")
+
 
 class JSONFormatter(TaskiqFormatter):
     """Default taskiq formatter."""
@@ -27,3 +32,12 @@ class JSONFormatter(TaskiqFormatter):
         :return: parsed taskiq message.
         """
         return TaskiqMessage.parse_raw(message)
+
+    def peek_valid(self, message: bytes) -> bool:
+        """
+        Checks that message looks like a JSON object.
+
+        :param message: broker's message.
+        :return: True if message starts with an opening brace.
+        """
+        return _JSON_OBJECT_START.match(message) is not None
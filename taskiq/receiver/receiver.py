@@ -1,23 +1,39 @@
 import asyncio
 import inspect
 from concurrent.futures import Executor
-from logging import getLogger
-from time import time
-from typing import Any, Callable, Dict, Optional, get_type_hints
+from dataclasses import dataclass
+from functools import partial
+from logging import DEBUG, getLogger
+from time import perf_counter
+from typing import (  # noqa: WPS235
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    get_type_hints,
+)
 
 from taskiq_dependencies import DependencyGraph
 
 from taskiq.abc.broker import AsyncBroker
 from taskiq.abc.middleware import TaskiqMiddleware
 from taskiq.context import Context
+from taskiq.decor import AsyncTaskiqDecoratedTask
+from taskiq.exceptions import TaskiqError
 from taskiq.message import TaskiqMessage
 from taskiq.receiver.params_parser import parse_params
 from taskiq.result import TaskiqResult
 from taskiq.state import TaskiqState
-from taskiq.utils import maybe_awaitable
 
 logger = getLogger(__name__)
 
+_SavedResult = Tuple[TaskiqMessage, TaskiqResult[Any]]
+_TaskRunner = Callable[[Callable[..., Any], TaskiqMessage], Awaitable[Any]]
+
 
 def _run_sync(target: Callable[..., Any], message: TaskiqMessage) -> Any:
     """
@@ -33,36 +49,308 @@ def _run_sync(target: Callable[..., Any], message: TaskiqMessage) -> Any:
     return target(*message.args, **message.kwargs)
 
 
+def _run_async(target: Callable[..., Any], message: TaskiqMessage) -> Awaitable[Any]:
+    """
+    Calls async function.
+
+    :param target: function to execute.
+    :param message: received message from broker.
+    :return: awaitable result of function's execution.
+    """
+    return target(*message.args, **message.kwargs)
+
+
+async def _run_inline(target: Callable[..., Any], message: TaskiqMessage) -> Any:
+    """
+    Runs sync function in the event loop.
+
+    Cheap sync functions are called directly,
+    to avoid sending them to the executor.
+
+    :param target: function to execute.
+    :param message: received message from broker.
+    :return: result of function's execution.
+    """
+    return target(*message.args, **message.kwargs)
+
+
+def _run_in_executor(
+    executor: Optional[Executor],
+    target: Callable[..., Any],
+    message: TaskiqMessage,
+) -> Awaitable[Any]:
+    """
+    Runs sync function in executor.
+
+    :param executor: executor for sync functions.
+    :param target: function to execute.
+    :param message: received message from broker.
+    :return: awaitable result of function's execution.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(executor, _run_sync, target, message)
+
+
+def _make_runner(
+    is_async: bool,
+    inline_sync: bool,
+    executor: Optional[Executor],
+) -> _TaskRunner:
+    """
+    Choose a function that executes targets.
+
+    The way of calling the target is chosen
+    once per task, so run_task doesn't check
+    whether the function is async for every message.
+
+    :param is_async: whether the target is a coroutine function.
+    :param inline_sync: whether sync target is called in the event loop.
+    :param executor: executor for sync functions.
+    :return: function that takes a target with a message
+        and returns awaitable result.
+    """
+    if is_async:
+        return _run_async
+    if inline_sync:
+        return _run_inline
+    # If this is a synchronous function we
+    # run it in executor.
+    return partial(_run_in_executor, executor)
+
+
+def _collect_hooks(
+    middlewares: "List[TaskiqMiddleware]",
+    hook_name: str,
+) -> List[Tuple[Callable[..., Any], bool]]:
+    """
+    Get bound hooks of middlewares and check if they're async.
+
+    :param middlewares: middlewares that implement the hook.
+    :param hook_name: name of middleware's method.
+    :return: list of hooks with flags whether they're coroutine functions.
+    """
+    hooks = []
+    for middleware in middlewares:
+        hook = getattr(middleware, hook_name)
+        hooks.append((hook, asyncio.iscoroutinefunction(hook)))
+    return hooks
+
+
+def _make_pre_execute_chain(
+    middlewares: "List[TaskiqMiddleware]",
+) -> "Optional[Callable[[TaskiqMessage], Awaitable[TaskiqMessage]]]":
+    """
+    Fuse pre_execute hooks in a single function.
+
+    Every hook receives the message returned by the previous one.
+
+    :param middlewares: middlewares that implement pre_execute.
+    :return: function that runs all hooks, or None if there're no hooks.
+    """
+    if not middlewares:
+        return None
+    hooks = _collect_hooks(middlewares, "pre_execute")
+
+    async def run_hooks(message: TaskiqMessage) -> TaskiqMessage:
+        for hook, is_async in hooks:
+            message = hook(message)
+            # Sync hooks are allowed to return awaitables too.
+            if is_async or inspect.isawaitable(message):
+                message = await message  # type: ignore
+        return message
+
+    return run_hooks
+
+
+def _make_hooks_chain(
+    middlewares: "List[TaskiqMiddleware]",
+    hook_name: str,
+) -> "Optional[Callable[..., Awaitable[None]]]":
+    """
+    Fuse hooks, that don't return anything, in a single function.
+
+    :param middlewares: middlewares that implement the hook.
+    :param hook_name: name of middleware's method.
+    :return: function that runs all hooks, or None if there're no hooks.
+    """
+    if not middlewares:
+        return None
+    hooks = _collect_hooks(middlewares, hook_name)
+
+    async def run_hooks(*args: Any) -> None:
+        for hook, is_async in hooks:
+            hook_result = hook(*args)
+            # Sync hooks are allowed to return awaitables too.
+            if is_async or inspect.isawaitable(hook_result):
+                await hook_result
+
+    return run_hooks
+
+
+@dataclass
+class TaskMeta:
+    """
+    Information about the task, collected by receiver.
+
+    All of it is needed to execute every message,
+    so it's stored in one object and found with a single lookup.
+    """
+
+    __slots__ = (
+        "func",
+        "signature",
+        "hints",
+        "hints_error",
+        "dependency_graph",
+        "runner",
+    )
+
+    func: Callable[..., Any]
+    signature: inspect.Signature
+    # Type hints are resolved on the first message.
+    hints: Optional[Dict[str, Any]]
+    # Error raised while resolving type hints.
+    hints_error: Optional[Exception]
+    # Graph is None if function has no dependencies.
+    dependency_graph: Optional[DependencyGraph]
+    runner: _TaskRunner
+
+    def get_hints(self) -> Dict[str, Any]:
+        """
+        Get type hints of the task.
+
+        Hints are needed only to parse parameters,
+        so they are resolved on the first call instead of
+        in prepare_task, where dependency graph has already
+        evaluated annotations of the function.
+
+        Hints and the error of their resolution are
+        memoized, so they are never resolved twice.
+
+        :raises TaskiqError: if annotations cannot be resolved.
+        :return: function's type hints.
+        """
+        if self.hints is None and self.hints_error is None:
+            try:
+                self.hints = get_type_hints(self.func)
+            except Exception as exc:
+                self.hints_error = exc
+        if self.hints is None:
+            raise TaskiqError("Cannot resolve type hints.") from self.hints_error
+        return self.hints
+
+
 class Receiver:
     """Class that uses as a callback handler."""
 
-    def __init__(
+    def __init__(  # noqa: WPS211
         self,
         broker: AsyncBroker,
         executor: Optional[Executor] = None,
         validate_params: bool = True,
         max_async_tasks: "Optional[int]" = None,
+        results_batch_size: int = 1,
+        executor_parse_threshold: "Optional[int]" = None,
     ) -> None:
         self.broker = broker
         self.executor = executor
         self.validate_params = validate_params
-        self.task_signatures: Dict[str, inspect.Signature] = {}
-        self.task_hints: Dict[str, Dict[str, Any]] = {}
-        self.dependency_graphs: Dict[str, DependencyGraph] = {}
+        self.tasks_meta: Dict[str, TaskMeta] = {}
         for task in self.broker.available_tasks.values():
-            self.task_signatures[task.task_name] = inspect.signature(task.original_func)
-            self.task_hints[task.task_name] = get_type_hints(task.original_func)
-            self.dependency_graphs[task.task_name] = DependencyGraph(task.original_func)
-        self.sem: "Optional[asyncio.Semaphore]" = None
+            self.prepare_task(task)
+        self.pre_execute_middlewares: "List[TaskiqMiddleware]" = []
+        self.post_execute_middlewares: "List[TaskiqMiddleware]" = []
+        self.post_save_middlewares: "List[TaskiqMiddleware]" = []
+        self.on_error_middlewares: "List[TaskiqMiddleware]" = []
+        self.update_middlewares()
+        self.broker.receivers.add(self)
+        self.max_async_tasks: "Optional[int]" = None
+        self._queue: "Optional[asyncio.Queue[bytes]]" = None
+        self._workers: "Set[asyncio.Task[None]]" = set()
+        self.results_batch_size = max(results_batch_size, 1)
+        self._results_queue: "Optional[asyncio.Queue[_SavedResult]]" = None
+        # Messages of this size or bigger are parsed in executor.
+        self.executor_parse_threshold = executor_parse_threshold
         if max_async_tasks is not None and max_async_tasks > 0:
-            self.sem = asyncio.Semaphore(max_async_tasks)
+            self.max_async_tasks = max_async_tasks
         else:
             logger.warning(
                 "Setting unlimited number of async tasks "
                 + "can result in undefined behavior",
             )
 
-    async def callback(  # noqa: C901, WPS213
+    def prepare_task(self, task: "AsyncTaskiqDecoratedTask[Any, Any]") -> None:
+        """
+        Collect all information about the task.
+
+        Signatures and dependency graphs
+        are computed once per task, because it's
+        expensive to do it for every message.
+
+        :param task: decorated task.
+        """
+        func = task.original_func
+        dependency_graph = DependencyGraph(func)
+        self.tasks_meta[task.task_name] = TaskMeta(
+            func=func,
+            signature=inspect.signature(func),
+            hints=None,
+            hints_error=None,
+            # We don't need to build resolving context
+            # for functions without dependencies.
+            dependency_graph=None if dependency_graph.is_empty() else dependency_graph,
+            runner=_make_runner(
+                asyncio.iscoroutinefunction(func),
+                bool(task.labels.get("inline_sync", False)),
+                self.executor,
+            ),
+        )
+
+    def update_middlewares(self) -> None:
+        """
+        Collect middlewares that implement worker-side hooks.
+
+        Middlewares are filtered once, so we don't
+        compare methods with base implementations
+        for every incoming message. Hooks of every kind
+        are fused in a single function.
+
+        Broker calls this method when new middlewares
+        are added with add_middlewares.
+        """
+        middlewares = self.broker.middlewares
+        self.pre_execute_middlewares = [
+            middleware
+            for middleware in middlewares
+            if type(middleware).pre_execute is not TaskiqMiddleware.pre_execute
+        ]
+        self.post_execute_middlewares = [
+            middleware
+            for middleware in middlewares
+            if type(middleware).post_execute is not TaskiqMiddleware.post_execute
+        ]
+        self.post_save_middlewares = [
+            middleware
+            for middleware in middlewares
+            if type(middleware).post_save is not TaskiqMiddleware.post_save
+        ]
+        self.on_error_middlewares = [
+            middleware
+            for middleware in middlewares
+            if type(middleware).on_error is not TaskiqMiddleware.on_error
+        ]
+        self._run_pre_execute = _make_pre_execute_chain(self.pre_execute_middlewares)
+        self._run_post_execute = _make_hooks_chain(
+            self.post_execute_middlewares,
+            "post_execute",
+        )
+        self._run_post_save = _make_hooks_chain(
+            self.post_save_middlewares,
+            "post_save",
+        )
+        self._run_on_error = _make_hooks_chain(self.on_error_middlewares, "on_error")
+
+    async def callback(  # noqa: C901
         self,
         message: bytes,
         raise_err: bool = False,
@@ -73,71 +361,50 @@ class Receiver:
         This method is used to process message,
         that came from brokers.
 
-        :raises Exception: if raise_err is true,
-            and excpetion were found while saving result.
+        If results are saved in batches, errors
+        of result backend are only logged.
+
         :param message: received message.
         :param raise_err: raise an error if cannot save result in
             result_backend.
         """
-        try:
-            taskiq_msg = self.broker.formatter.loads(message=message)
-        except Exception as exc:
-            logger.warning(
-                "Cannot parse message: %s. Skipping execution.\n %s",
-                message,
-                exc,
-                exc_info=True,
-            )
+        taskiq_msg = await self._parse_message(message)
+        if taskiq_msg is None:
             return
-        logger.debug(f"Received message: {taskiq_msg}")
-        if taskiq_msg.task_name not in self.broker.available_tasks:
-            logger.warning(
-                'task "%s" is not found. Maybe you forgot to import it?',
-                taskiq_msg.task_name,
-            )
+        # Message's repr is expensive, so we build it only if needed.
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Received message: %s", taskiq_msg)
+        task_name = taskiq_msg.task_name
+        meta = self._resolve_task_meta(task_name)
+        if meta is None:
             return
         logger.debug(
             "Function for task %s is resolved. Executing...",
-            taskiq_msg.task_name,
+            task_name,
         )
-        for middleware in self.broker.middlewares:
-            if middleware.__class__.pre_execute != TaskiqMiddleware.pre_execute:
-                taskiq_msg = await maybe_awaitable(
-                    middleware.pre_execute(
-                        taskiq_msg,
-                    ),
-                )
+        if self._run_pre_execute is not None:
+            taskiq_msg = await self._run_pre_execute(taskiq_msg)
+            if taskiq_msg.task_name != task_name:
+                # Middleware has rerouted the message to another task.
+                meta = self._resolve_task_meta(taskiq_msg.task_name)
+                if meta is None:
+                    return
 
         logger.info(
             "Executing task %s with ID: %s",
             taskiq_msg.task_name,
             taskiq_msg.task_id,
         )
-        result = await self.run_task(
-            target=self.broker.available_tasks[taskiq_msg.task_name].original_func,
-            message=taskiq_msg,
-        )
-        for middleware in self.broker.middlewares:
-            if middleware.__class__.post_execute != TaskiqMiddleware.post_execute:
-                await maybe_awaitable(middleware.post_execute(taskiq_msg, result))
-        try:
-            await self.broker.result_backend.set_result(taskiq_msg.task_id, result)
-            for middleware in self.broker.middlewares:
-                if middleware.__class__.post_save != TaskiqMiddleware.post_save:
-                    await maybe_awaitable(middleware.post_save(taskiq_msg, result))
-        except Exception as exc:
-            logger.exception(
-                "Can't set result in result backend. Cause: %s",
-                exc,
-                exc_info=True,
-            )
-            if raise_err:
-                raise exc
+        result = await self.run_task(target=meta.func, message=taskiq_msg, meta=meta)
+        if self._run_post_execute is not None:
+            await self._run_post_execute(taskiq_msg, result)
+        await self._save_result(taskiq_msg, result, raise_err)
 
     async def run_task(  # noqa: C901, WPS210
         self,
         target: Callable[..., Any],
         message: TaskiqMessage,
+        meta: "Optional[TaskMeta]" = None,
     ) -> TaskiqResult[Any]:
         """
         This function actually executes functions.
@@ -148,34 +415,65 @@ class Receiver:
         If the target function is async
         it awaits it, if it's sync
         it wraps it in run_sync and executes in
-        threadpool executor.
+        threadpool executor. Sync tasks with
+        `inline_sync` label are called directly
+        in the event loop.
 
         Also it uses LogsCollector to
         collect logs.
 
+        If meta is passed, it must describe the target.
+        Otherwise the way of calling the target is checked
+        on every call, and dependencies with type hints
+        are taken from the task with the message's name.
+
         :param target: function to execute.
         :param message: received message.
+        :param meta: prepared information about the target.
         :return: result of execution.
         """
-        loop = asyncio.get_running_loop()
         returned = None
         found_exception = None
-        signature = None
-        if self.validate_params:
-            signature = self.task_signatures.get(message.task_name)
-        dependency_graph = self.dependency_graphs.get(message.task_name)
-        parse_params(signature, self.task_hints.get(message.task_name) or {}, message)
+        if meta is None:
+            # Target wasn't prepared, so we check it on every call.
+            runner = _make_runner(
+                asyncio.iscoroutinefunction(target),
+                inline_sync=False,
+                executor=self.executor,
+            )
+            meta = self.tasks_meta.get(message.task_name)
+        else:
+            runner = meta.runner
+        dependency_graph = None
+        if meta is not None:
+            dependency_graph = meta.dependency_graph
+            if self.validate_params:
+                try:
+                    type_hints = meta.get_hints()
+                except Exception as exc:
+                    # Task cannot be executed if its annotations are broken.
+                    logger.error(
+                        "Cannot resolve type hints of task %s: %s",
+                        message.task_name,
+                        exc,
+                        exc_info=True,
+                    )
+                    return await self._assemble_result(message, None, exc, 0)
+                # If function has no annotations, there's nothing to parse.
+                if type_hints:
+                    parse_params(meta.signature, type_hints, message)
 
         dep_ctx = None
-        if dependency_graph:
+        if dependency_graph is not None:
             # Create a context for dependency resolving.
-            broker_ctx = self.broker.custom_dependency_context
-            broker_ctx.update(
-                {
-                    Context: Context(message, self.broker),
-                    TaskiqState: self.broker.state,
-                },
-            )
+            # Broker's dict is copied, so concurrent tasks
+            # don't overwrite each other's contexts.
+            broker = self.broker
+            broker_ctx = {
+                **broker.custom_dependency_context,
+                Context: Context(message, broker),
+                TaskiqState: broker.state,
+            }
             dep_ctx = dependency_graph.async_ctx(broker_ctx)
             # Resolve all function's dependencies.
             dep_kwargs = await dep_ctx.resolve_kwargs()
@@ -183,20 +481,9 @@ class Receiver:
                 if key not in message.kwargs:
                     message.kwargs[key] = val
         # Start a timer.
-        start_time = time()
+        start_time = perf_counter()
         try:
-            # If the function is a coroutine we await it.
-            if asyncio.iscoroutinefunction(target):
-                returned = await target(*message.args, **message.kwargs)
-            else:
-                # If this is a synchronous function we
-                # run it in executor.
-                returned = await loop.run_in_executor(
-                    self.executor,
-                    _run_sync,
-                    target,
-                    message,
-                )
+            returned = await runner(target, message)
         except Exception as exc:
             found_exception = exc
             logger.error(
@@ -205,11 +492,187 @@ class Receiver:
                 exc_info=True,
             )
         # Stop the timer.
-        execution_time = time() - start_time
+        execution_time = perf_counter() - start_time
         if dep_ctx:
             await dep_ctx.close()
 
-        # Assemble result.
+        return await self._assemble_result(
+            message,
+            returned,
+            found_exception,
+            execution_time,
+        )
+
+    def set_concurrency(self, max_async_tasks: int) -> None:
+        """
+        Change the number of concurrently running tasks.
+
+        This method can be called while receiver
+        is listening. If the limit is increased,
+        new workers are started immediately.
+        If it's decreased, extra workers stop
+        after finishing their current tasks.
+
+        If receiver was started without limit,
+        new value is used only on the next listen() call.
+
+        :param max_async_tasks: new limit.
+        :raises ValueError: if limit is not positive.
+        """
+        if max_async_tasks <= 0:
+            raise ValueError("Number of async tasks must be positive.")
+        self.max_async_tasks = max_async_tasks
+        if self._queue is not None:
+            self._spawn_workers(self._queue)
+
+    async def listen(self) -> None:  # pragma: no cover
+        """
+        This function iterates over tasks asynchronously.
+
+        It uses listen() method of an AsyncBroker
+        to get new messages from queues.
+
+        If number of async tasks is limited,
+        messages are processed by a pool of workers,
+        that read them from a bounded queue.
+
+        If results_batch_size is greater than one,
+        results are saved in batches by a separate writer.
+        """
+        await self.broker.startup()
+        # Startup handlers may change middlewares.
+        self.update_middlewares()
+        logger.info("Listening started.")
+        writer = None
+        if self.results_batch_size > 1:
+            self._results_queue = asyncio.Queue(maxsize=self.results_batch_size * 2)
+            writer = asyncio.create_task(self._results_writer(self._results_queue))
+        # Writer must be stopped even if listening is cancelled.
+        try:  # noqa: WPS501
+            if self.max_async_tasks is None:
+                await self._listen_unlimited()
+            else:
+                await self._listen_pool(self.max_async_tasks)
+            if self._results_queue is not None:
+                await self._results_queue.join()
+        finally:
+            self._results_queue = None
+            if writer is not None:
+                writer.cancel()
+
+    def _resolve_task_meta(self, task_name: str) -> "Optional[TaskMeta]":
+        """
+        Find prepared information about the task.
+
+        Tasks registered after the receiver was created
+        are prepared on their first message.
+
+        :param task_name: name of the task.
+        :return: task's meta or None if task is unknown.
+        """
+        meta = self.tasks_meta.get(task_name)
+        if meta is None:
+            task = self.broker.available_tasks.get(task_name)
+            if task is None:
+                logger.warning(
+                    'task "%s" is not found. Maybe you forgot to import it?',
+                    task_name,
+                )
+                return None
+            self.prepare_task(task)
+            meta = self.tasks_meta[task_name]
+        return meta
+
+    async def _parse_message(self, message: bytes) -> Optional[TaskiqMessage]:
+        """
+        Parse message that came from broker.
+
+        :param message: received message.
+        :return: parsed message or None if it's invalid.
+        """
+        formatter = self.broker.formatter
+        if not formatter.peek_valid(message):
+            logger.warning(
+                "Cannot parse message: %s. Skipping execution.",
+                message,
+            )
+            return None
+        try:
+            threshold = self.executor_parse_threshold
+            if threshold is not None and len(message) >= threshold:
+                # Big messages are parsed in executor,
+                # so the event loop isn't blocked by parsing.
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self.executor,
+                    formatter.loads,
+                    message,
+                )
+            return formatter.loads(message=message)
+        except Exception as exc:
+            logger.warning(
+                "Cannot parse message: %s. Skipping execution.\n %s",
+                message,
+                exc,
+                exc_info=True,
+            )
+            return None
+
+    async def _save_result(
+        self,
+        message: TaskiqMessage,
+        result: TaskiqResult[Any],
+        raise_err: bool,
+    ) -> None:
+        """
+        Save result of the task and run post save hooks.
+
+        If results are saved in batches,
+        the result is sent to results writer.
+
+        :raises Exception: if raise_err is true,
+            and excpetion were found while saving result.
+        :param message: executed message.
+        :param result: result of the execution.
+        :param raise_err: raise an error if cannot save result in
+            result_backend.
+        """
+        results_queue = self._results_queue
+        if results_queue is not None:
+            # Result will be saved by results writer along with others.
+            await results_queue.put((message, result))
+            return
+        try:
+            await self.broker.result_backend.set_result(message.task_id, result)
+            if self._run_post_save is not None:
+                await self._run_post_save(message, result)
+        except Exception as exc:
+            logger.exception(
+                "Can't set result in result backend. Cause: %s",
+                exc,
+                exc_info=True,
+            )
+            if raise_err:
+                raise exc
+
+    async def _assemble_result(
+        self,
+        message: TaskiqMessage,
+        returned: Any,
+        found_exception: Optional[Exception],
+        execution_time: float,
+    ) -> TaskiqResult[Any]:
+        """
+        Create result of the execution.
+
+        If exception is found, on_error hooks are called.
+
+        :param message: received message.
+        :param returned: value returned by the task.
+        :param found_exception: exception raised during the execution.
+        :param execution_time: time of the execution.
+        :return: result of execution.
+        """
         result: "TaskiqResult[Any]" = TaskiqResult(
             is_err=found_exception is not None,
             log=None,
@@ -217,49 +680,135 @@ class Receiver:
             execution_time=execution_time,
         )
         # If exception is found we execute middlewares.
-        if found_exception is not None:
-            for middleware in self.broker.middlewares:
-                if middleware.__class__.on_error != TaskiqMiddleware.on_error:
-                    await maybe_awaitable(
-                        middleware.on_error(
-                            message,
-                            result,
-                            found_exception,
-                        ),
-                    )
+        if found_exception is not None and self._run_on_error is not None:
+            await self._run_on_error(message, result, found_exception)
 
         return result
 
-    async def listen(self) -> None:  # pragma: no cover
+    def _spawn_workers(self, queue: "asyncio.Queue[bytes]") -> None:
         """
-        This function iterates over tasks asynchronously.
+        Start workers until their number reaches the limit.
 
-        It uses listen() method of an AsyncBroker
-        to get new messages from queues.
+        :param queue: queue with incoming messages.
         """
-        await self.broker.startup()
-        logger.info("Listening started.")
-        tasks = set()
+        while len(self._workers) < (self.max_async_tasks or 0):
+            self._workers.add(asyncio.create_task(self._worker(queue)))
+
+    async def _worker(self, queue: "asyncio.Queue[bytes]") -> None:
+        """
+        Process messages from the queue.
+
+        Worker stops when there're more
+        workers than allowed running tasks.
+
+        :param queue: queue with incoming messages.
+        """
+        while True:  # noqa: WPS457
+            message = await queue.get()
+            try:
+                await self.callback(message=message, raise_err=False)
+            except Exception as exc:
+                logger.exception(
+                    "Unexpected error while processing message: %s",
+                    exc,
+                    exc_info=True,
+                )
+            finally:
+                queue.task_done()
+            if len(self._workers) > (self.max_async_tasks or 0):
+                self._workers.discard(asyncio.current_task())  # type: ignore
+                return
 
-        def task_cb(task: "asyncio.Task[Any]") -> None:
-            """
-            Callback for tasks.
+    async def _results_writer(self, queue: "asyncio.Queue[_SavedResult]") -> None:
+        """
+        Save results from the queue in batches.
 
-            This function used to remove task
-            from the list of active tasks and release
-            the semaphore, so other tasks can use it.
+        Writer takes all results that are ready
+        at the moment, but no more than results_batch_size,
+        and saves them with a single set_results call.
 
-            :param task: finished task
-            """
-            tasks.discard(task)
-            if self.sem is not None:
-                self.sem.release()
+        :param queue: queue with results to save.
+        """
+        while True:  # noqa: WPS457
+            batch = [await queue.get()]
+            while len(batch) < self.results_batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._save_batch(batch)
+            except Exception as exc:
+                logger.exception(
+                    "Can't set results in result backend. Cause: %s",
+                    exc,
+                    exc_info=True,
+                )
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _save_batch(self, batch: "List[_SavedResult]") -> None:
+        """
+        Save a batch of results.
+
+        Post save hooks are called only for
+        saved results. Errors are logged for
+        every result separately.
+
+        :param batch: messages along with their results.
+        """
+        errors = await self.broker.result_backend.set_results(
+            [(message.task_id, result) for message, result in batch],
+        )
+        for (message, result), error in zip(batch, errors):
+            if error is not None:
+                logger.error(
+                    "Can't set result of task %s in result backend. Cause: %s",
+                    message.task_id,
+                    error,
+                    exc_info=error,
+                )
+            elif self._run_post_save is not None:
+                try:
+                    await self._run_post_save(message, result)
+                except Exception as exc:
+                    logger.exception(
+                        "Post save hooks of task %s failed. Cause: %s",
+                        message.task_id,
+                        exc,
+                        exc_info=True,
+                    )
+
+    async def _listen_pool(self, max_async_tasks: int) -> None:
+        """
+        Process messages with a pool of workers.
+
+        :param max_async_tasks: initial number of workers.
+        """
+        queue: "asyncio.Queue[bytes]" = asyncio.Queue(maxsize=max_async_tasks * 2)
+        self._queue = queue
+        self._spawn_workers(queue)
+        # Workers must be stopped even if listening is cancelled.
+        try:  # noqa: WPS501
+            async for message in self.broker.listen():
+                # Waits for workers if the queue is full.
+                await queue.put(message)
+            await queue.join()
+        finally:
+            self._queue = None
+            for worker in self._workers:
+                worker.cancel()
+            self._workers.clear()
+
+    async def _listen_unlimited(self) -> None:  # pragma: no cover
+        """Start a new task for every incoming message."""
+        tasks: "Set[asyncio.Task[Any]]" = set()
 
         async for message in self.broker.listen():
-            # Waits for semaphore to be released.
-            if self.sem is not None:
-                await self.sem.acquire()
-            task = asyncio.create_task(self.callback(message=message, raise_err=False))
+            task = asyncio.create_task(
+                self.callback(message=message, raise_err=False),
+            )
             tasks.add(task)
 
             # We want the task to remove itself from the set when it's done.
@@ -267,4 +816,8 @@ class Receiver:
             # Because python's GC can silently cancel task
             # and it considered to be Hisenbug.
             # https://textual.textualize.io/blog/2023/02/11/the-heisenbug-lurking-in-your-async-code/
-            task.add_done_callback(task_cb)
+            task.add_done_callback(tasks.discard)
+
+        # Wait for running tasks, so their results are saved.
+        if tasks:
+            await asyncio.wait(tasks)
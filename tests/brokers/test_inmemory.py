@@ -4,7 +4,9 @@ import uuid
 import pytest
 
 from taskiq import InMemoryBroker
+from taskiq.abc.middleware import TaskiqMiddleware
 from taskiq.events import TaskiqEvents
+from taskiq.message import TaskiqMessage
 from taskiq.state import TaskiqState
 
 
@@ -85,3 +87,24 @@ async def test_execution() -> None:
 
     result = await task.wait_result()
     assert result.return_value == test_value
+
+
+@pytest.mark.anyio
+async def test_middlewares_added_after_init() -> None:
+    broker = InMemoryBroker()
+    executed = []
+
+    class _TestMiddleware(TaskiqMiddleware):
+        def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+            executed.append(message.task_name)
+            return message
+
+    @broker.task
+    async def test_task() -> None:
+        pass
+
+    broker.add_middlewares(_TestMiddleware())
+
+    task = await test_task.kiq()
+    await task.wait_result()
+    assert executed == [test_task.task_name]
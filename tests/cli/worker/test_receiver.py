@@ -1,6 +1,7 @@
 import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, AsyncGenerator, Callable, List, Optional, TypeVar
+from typing import Any, AsyncGenerator, Callable, List, Optional, Tuple, TypeVar
 
 import pytest
 from taskiq_dependencies import Depends
@@ -8,7 +9,10 @@ from taskiq_dependencies import Depends
 from taskiq.abc.broker import AsyncBroker
 from taskiq.abc.middleware import TaskiqMiddleware
 from taskiq.abc.result_backend import AsyncResultBackend
-from taskiq.brokers.inmemory_broker import InMemoryBroker
+from taskiq.brokers.inmemory_broker import InMemoryBroker, InmemoryResultBackend
+from taskiq.context import Context
+from taskiq.events import TaskiqEvents
+from taskiq.formatters.json_formatter import JSONFormatter
 from taskiq.message import TaskiqMessage
 from taskiq.receiver import Receiver
 from taskiq.result import TaskiqResult
@@ -293,3 +297,539 @@ async def test_callback_semaphore() -> None:
     assert sem_num == max_async_tasks
     await listen_task
     assert sem_num == max_async_tasks + 2
+
+
+@pytest.mark.anyio
+async def test_prepare_task_runners() -> None:
+    """Tests that receiver picks runners by the kind of the task."""
+    broker = InMemoryBroker()
+
+    @broker.task
+    async def async_runner_task() -> int:
+        return threading.get_ident()
+
+    @broker.task
+    def sync_runner_task() -> int:
+        return threading.get_ident()
+
+    receiver = get_receiver(broker)
+
+    async_result = await receiver.run_task(
+        async_runner_task.original_func,
+        TaskiqMessage(
+            task_id="",
+            task_name=async_runner_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        ),
+        meta=receiver.tasks_meta[async_runner_task.task_name],
+    )
+    sync_result = await receiver.run_task(
+        sync_runner_task.original_func,
+        TaskiqMessage(
+            task_id="",
+            task_name=sync_runner_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        ),
+        meta=receiver.tasks_meta[sync_runner_task.task_name],
+    )
+
+    assert async_result.return_value == threading.get_ident()
+    assert sync_result.return_value != threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_run_task_inline_sync() -> None:
+    """Tests that inline sync tasks are executed in the event loop thread."""
+    broker = InMemoryBroker()
+
+    @broker.task(inline_sync=True)
+    def test_func() -> int:
+        return threading.get_ident()
+
+    receiver = get_receiver(broker)
+
+    result = await receiver.run_task(
+        test_func.original_func,
+        TaskiqMessage(
+            task_id="",
+            task_name=test_func.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        ),
+        meta=receiver.tasks_meta[test_func.task_name],
+    )
+    assert result.return_value == threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_set_concurrency() -> None:
+    """Test that concurrency limit can be changed while listening."""
+    broker = BrokerForTests()
+    running = 0
+
+    @broker.task
+    async def task_sem() -> int:
+        nonlocal running  # noqa: WPS420
+        running += 1
+        await asyncio.sleep(1)
+        return 1
+
+    broker.to_send = [
+        TaskiqMessage(
+            task_id="test_sem",
+            task_name=task_sem.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        )
+        for _ in range(4)
+    ]
+
+    receiver = get_receiver(broker, max_async_tasks=1)
+
+    listen_task = asyncio.create_task(receiver.listen())
+    await asyncio.sleep(0.3)
+    assert running == 1
+    receiver.set_concurrency(3)
+    await asyncio.sleep(0.3)
+    assert running == 3
+    await listen_task
+
+
+@pytest.mark.anyio
+async def test_callback_task_registered_later() -> None:
+    """Tests that tasks registered after receiver's creation are executed."""
+    broker = InMemoryBroker()
+    receiver = get_receiver(broker)
+    called_times = 0
+
+    @broker.task
+    async def late_task() -> None:
+        nonlocal called_times  # noqa: WPS420
+        called_times += 1
+
+    broker_message = broker.formatter.dumps(
+        TaskiqMessage(
+            task_id="task_id",
+            task_name=late_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        ),
+    )
+
+    await receiver.callback(broker_message.message)
+    assert called_times == 1
+    assert receiver.tasks_meta[late_task.task_name].func is late_task.original_func
+
+
+@pytest.mark.anyio
+async def test_run_task_lazy_type_hints() -> None:
+    """Tests that type hints are resolved on the first message."""
+    broker = InMemoryBroker()
+
+    @broker.task
+    async def hinted_task(param: int) -> int:
+        return param
+
+    receiver = get_receiver(broker)
+    assert receiver.tasks_meta[hinted_task.task_name].hints is None
+
+    result = await receiver.run_task(
+        hinted_task.original_func,
+        TaskiqMessage(
+            task_id="",
+            task_name=hinted_task.task_name,
+            labels={},
+            args=["1"],
+            kwargs={},
+        ),
+        meta=receiver.tasks_meta[hinted_task.task_name],
+    )
+    assert result.return_value == 1
+    assert receiver.tasks_meta[hinted_task.task_name].hints == {
+        "param": int,
+        "return": int,
+    }
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("message", [b"", b"   ", b"not a json", b"[1, 2]"])
+async def test_callback_invalid_message_skipped(message: bytes) -> None:
+    """Tests that obviously invalid messages are skipped before parsing."""
+
+    class _SpyFormatter(JSONFormatter):
+        def __init__(self) -> None:
+            self.parsed: List[bytes] = []
+
+        def loads(self, message: bytes) -> TaskiqMessage:
+            self.parsed.append(message)
+            return super().loads(message)
+
+    formatter = _SpyFormatter()
+    broker = InMemoryBroker()
+    broker.formatter = formatter
+    receiver = get_receiver(broker)
+
+    await receiver.callback(message)
+
+    assert formatter.parsed == []
+
+
+@pytest.mark.anyio
+async def test_run_task_doesnt_modify_broker_ctx() -> None:
+    """Tests that task's context isn't stored in broker's dependency context."""
+    broker = InMemoryBroker()
+
+    @broker.task
+    def ctx_task(context: Context = Depends()) -> str:
+        return context.message.task_id
+
+    receiver = get_receiver(broker)
+
+    result = await receiver.run_task(
+        ctx_task,
+        TaskiqMessage(
+            task_id="ctx_id",
+            task_name=ctx_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        ),
+    )
+    assert result.return_value == "ctx_id"
+    assert Context not in broker.custom_dependency_context
+
+
+@pytest.mark.anyio
+async def test_listen_results_batching() -> None:
+    """Tests that results are saved in batches while listening."""
+
+    class _BatchBackend(InmemoryResultBackend[Any]):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: List[int] = []
+
+        async def set_results(
+            self,
+            results: "List[Tuple[str, TaskiqResult[Any]]]",
+        ) -> "List[Optional[BaseException]]":
+            self.batches.append(len(results))
+            return await super().set_results(results)
+
+    backend = _BatchBackend()
+    broker = BrokerForTests(result_backend=backend)
+
+    @broker.task
+    async def batched_task() -> None:
+        await asyncio.sleep(0.1)
+
+    broker.to_send = [
+        TaskiqMessage(
+            task_id=str(task_num),
+            task_name=batched_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        )
+        for task_num in range(4)
+    ]
+    receiver = Receiver(
+        broker,
+        executor=ThreadPoolExecutor(max_workers=10),
+        max_async_tasks=4,
+        results_batch_size=4,
+    )
+
+    await receiver.listen()
+    assert sum(backend.batches) == 4
+    assert len(backend.batches) < 4
+    assert set(backend.results) == {"0", "1", "2", "3"}
+
+
+def test_prepare_task_without_dependencies() -> None:
+    """Tests that empty dependency graphs are not stored."""
+    broker = InMemoryBroker()
+
+    @broker.task
+    async def no_deps_task(param: int) -> int:
+        return param
+
+    @broker.task
+    async def deps_task(context: Context = Depends()) -> None:
+        pass
+
+    receiver = get_receiver(broker)
+
+    assert receiver.tasks_meta[no_deps_task.task_name].dependency_graph is None
+    assert receiver.tasks_meta[deps_task.task_name].dependency_graph is not None
+
+
+@pytest.mark.anyio
+async def test_callback_pre_execute_chain() -> None:
+    """Tests that sync and async pre_execute hooks are chained."""
+
+    class _SyncMiddleware(TaskiqMiddleware):
+        def pre_execute(self, message: "TaskiqMessage") -> "TaskiqMessage":
+            message.args.append("sync")
+            return message
+
+    class _AsyncMiddleware(TaskiqMiddleware):
+        async def pre_execute(self, message: "TaskiqMessage") -> "TaskiqMessage":
+            message.args.append("async")
+            return message
+
+    broker = InMemoryBroker()
+    broker.add_middlewares(_SyncMiddleware(), _AsyncMiddleware())
+    received: List[str] = []
+
+    @broker.task
+    async def chain_task(*args: str) -> None:
+        received.extend(args)
+
+    receiver = get_receiver(broker)
+    broker_message = broker.formatter.dumps(
+        TaskiqMessage(
+            task_id="task_id",
+            task_name=chain_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        ),
+    )
+
+    await receiver.callback(broker_message.message)
+    assert received == ["sync", "async"]
+
+
+@pytest.mark.anyio
+async def test_callback_parse_in_executor() -> None:
+    """Tests that big messages are parsed in executor."""
+
+    class _ThreadFormatter(JSONFormatter):
+        def __init__(self) -> None:
+            self.threads: List[int] = []
+
+        def loads(self, message: bytes) -> TaskiqMessage:
+            self.threads.append(threading.get_ident())
+            return super().loads(message)
+
+    formatter = _ThreadFormatter()
+    broker = InMemoryBroker()
+    broker.formatter = formatter
+
+    @broker.task
+    async def parsed_task() -> None:
+        pass
+
+    receiver = Receiver(
+        broker,
+        executor=ThreadPoolExecutor(max_workers=1),
+        executor_parse_threshold=1,
+    )
+    broker_message = broker.formatter.dumps(
+        TaskiqMessage(
+            task_id="task_id",
+            task_name=parsed_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        ),
+    )
+
+    await receiver.callback(broker_message.message)
+    assert formatter.threads
+    assert formatter.threads[0] != threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_run_task_target_differs_from_task_name() -> None:
+    """Tests that run_task calls the target by its own kind."""
+    broker = InMemoryBroker()
+
+    @broker.task
+    async def async_target() -> str:
+        return "async"
+
+    @broker.task
+    def sync_named() -> str:
+        return "sync"
+
+    receiver = get_receiver(broker)
+    message = TaskiqMessage(
+        task_id="",
+        task_name=sync_named.task_name,
+        labels={},
+        args=[],
+        kwargs={},
+    )
+
+    result = await receiver.run_task(async_target.original_func, message)
+    assert not result.is_err
+    assert result.return_value == "async"
+
+    result = await receiver.run_task(
+        async_target.original_func,
+        message,
+        meta=receiver.tasks_meta[async_target.task_name],
+    )
+    assert result.return_value == "async"
+
+
+@pytest.mark.anyio
+async def test_callback_pre_execute_reroutes_task() -> None:
+    """Tests that middleware can change the task that will be executed."""
+    broker = InMemoryBroker()
+
+    @broker.task
+    async def original_task() -> str:
+        return "original"
+
+    @broker.task
+    async def rerouted_task() -> str:
+        return "rerouted"
+
+    class _RerouteMiddleware(TaskiqMiddleware):
+        def pre_execute(self, message: "TaskiqMessage") -> "TaskiqMessage":
+            message.task_name = rerouted_task.task_name
+            return message
+
+    broker.add_middlewares(_RerouteMiddleware())
+    receiver = get_receiver(broker)
+    broker_message = broker.formatter.dumps(
+        TaskiqMessage(
+            task_id="reroute_id",
+            task_name=original_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        ),
+    )
+
+    await receiver.callback(broker_message.message)
+    result = await broker.result_backend.get_result("reroute_id")
+    assert result.return_value == "rerouted"
+
+
+@pytest.mark.anyio
+async def test_callback_unresolvable_type_hints() -> None:
+    """Tests that broken annotations produce an error result."""
+    broker = InMemoryBroker()
+    called_times = 0
+
+    @broker.task
+    async def broken_hints_task(param: "UnknownType") -> None:  # type: ignore # noqa
+        nonlocal called_times  # noqa: WPS420
+        called_times += 1
+
+    receiver = get_receiver(broker)
+    for task_id in ("first", "second"):
+        broker_message = broker.formatter.dumps(
+            TaskiqMessage(
+                task_id=task_id,
+                task_name=broken_hints_task.task_name,
+                labels={},
+                args=[1],
+                kwargs={},
+            ),
+        )
+        await receiver.callback(broker_message.message)
+        result = await broker.result_backend.get_result(task_id)
+        assert result.is_err
+
+    assert called_times == 0
+    meta = receiver.tasks_meta[broken_hints_task.task_name]
+    assert isinstance(meta.hints_error, NameError)
+
+
+@pytest.mark.anyio
+async def test_callback_middlewares_added_later() -> None:
+    """Tests that receiver calls middlewares added after its creation."""
+    broker = BrokerForTests()
+    executed: List[str] = []
+
+    class _LateMiddleware(TaskiqMiddleware):
+        def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+            executed.append(message.task_id)
+            return message
+
+    @broker.task
+    async def late_middleware_task() -> None:
+        pass
+
+    broker.to_send = [
+        TaskiqMessage(
+            task_id=task_id,
+            task_name=late_middleware_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        )
+        for task_id in ("added", "startup")
+    ]
+    receiver = get_receiver(broker)
+
+    broker.add_middlewares(_LateMiddleware())
+    await receiver.callback(broker.formatter.dumps(broker.to_send[0]).message)
+    assert executed == ["added"]
+
+    executed.clear()
+    broker.middlewares.clear()
+    broker.add_event_handler(
+        TaskiqEvents.WORKER_STARTUP,
+        lambda state: broker.middlewares.append(_LateMiddleware()),
+    )
+    broker.to_send = broker.to_send[1:]
+    await receiver.listen()
+    assert executed == ["startup"]
+
+
+@pytest.mark.anyio
+async def test_listen_results_batching_partial_failure() -> None:
+    """Tests that results saved in a failed batch are handled as saved."""
+
+    class _FailingBackend(InmemoryResultBackend[Any]):
+        async def set_result(self, task_id: str, result: TaskiqResult[Any]) -> None:
+            if task_id == "bad":
+                raise ValueError("Cannot save result.")
+            await super().set_result(task_id, result)
+
+    saved: List[str] = []
+
+    class _PostSaveMiddleware(TaskiqMiddleware):
+        def post_save(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+            saved.append(message.task_id)
+
+    backend = _FailingBackend()
+    broker = BrokerForTests(result_backend=backend)
+    broker.add_middlewares(_PostSaveMiddleware())
+
+    @broker.task
+    async def partially_saved_task() -> None:
+        await asyncio.sleep(0.1)
+
+    broker.to_send = [
+        TaskiqMessage(
+            task_id=task_id,
+            task_name=partially_saved_task.task_name,
+            labels={},
+            args=[],
+            kwargs={},
+        )
+        for task_id in ("a", "bad", "c")
+    ]
+    receiver = Receiver(
+        broker,
+        executor=ThreadPoolExecutor(max_workers=10),
+        max_async_tasks=3,
+        results_batch_size=3,
+    )
+
+    await receiver.listen()
+    assert set(backend.results) == {"a", "c"}
+    assert sorted(saved) == ["a", "c"]